@@ -8,83 +8,311 @@ Reads multiple k6 test result JSON files and generates:
 3. Resource utilization charts from Prometheus metrics CSV files
 """
 
+import io
+import fnmatch
+import functools
+import hashlib
 import json
 import glob
 import os
 import re
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # charts are only written to files; skip GUI backend detection
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+# Batch rendering: merge near-collinear path vertices and split very long
+# paths so Agg does not rasterize them in one go
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
 import numpy as np
 
-def load_summary_files(pattern="summary_*.json"):
-    """Load all summary JSON files matching the pattern."""
-    files = glob.glob(pattern)
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json parser
+    orjson = None
+
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:  # optional, falls back to the pandas C parser
+    pyarrow = None
+
+try:
+    import polars as pl
+except ImportError:  # optional, preferred metrics CSV reader when installed with pyarrow
+    pl = None
+
+# The Polars reader needs read_csv(schema_overrides=...), comment_prefix,
+# pl.String and concat(how='diagonal_relaxed'), all present from 0.20.31;
+# older releases use the PyArrow/pandas readers instead
+POLARS_MIN_VERSION = (0, 20, 31)
+if pl is not None and tuple(int(part) for part in re.findall(r'\d+', pl.__version__)[:3]) < POLARS_MIN_VERSION:
+    pl = None
+
+# Metrics file name, e.g. metrics_1_concurrency_10.csv -> experiment "1_concurrency_10"
+_METRICS_FILE_RE = re.compile(r'metrics_(.+)\.(csv|log)')
+# Experiment name: {tenants}_concurrency_{concurrency} (e.g., "1_concurrency_10", "10_concurrency_50")
+_EXPERIMENT_RE = re.compile(r'^(\d+)_concurrency_(\d+)')
+
+
+@functools.lru_cache(maxsize=None)
+def _name_matcher(name_pattern):
+    """Compiled match function for a glob file-name pattern, built once per pattern."""
+    return re.compile(fnmatch.translate(name_pattern)).match
+
+
+def _find_files_many(patterns):
+    """Expand several glob patterns, listing each directory once with os.scandir.
+    
+    Returns one list of paths per pattern. Patterns whose directory part
+    itself contains wildcards fall back to glob.glob.
+    """
+    listings = {}  # directory -> DirEntry list
+    results = []
+    for pattern in patterns:
+        directory, name_pattern = os.path.split(pattern)
+        if glob.has_magic(directory):
+            results.append(glob.glob(pattern))
+            continue
+        
+        if directory not in listings:
+            try:
+                with os.scandir(directory or '.') as entries:
+                    listings[directory] = list(entries)
+            except FileNotFoundError:
+                listings[directory] = []
+        
+        match = _name_matcher(name_pattern)
+        include_hidden = name_pattern.startswith('.')
+        results.append([os.path.join(directory, entry.name) for entry in listings[directory]
+                        if (include_hidden or not entry.name.startswith('.'))
+                        and match(entry.name) and entry.is_file()])
+    return results
+
+
+def _find_files(pattern):
+    """Expand a glob pattern with a single os.scandir of its directory."""
+    return _find_files_many([pattern])[0]
+
+
+def _parse_experiment(experiment):
+    """Return (tenants, concurrency) parsed from an experiment name, or (None, None)."""
+    match = _EXPERIMENT_RE.match(experiment)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    return None, None
+
+
+def _read_json(filepath):
+    """Parse a JSON file, using orjson when it is installed."""
+    # Both parsers accept the raw bytes, so skip the text-mode decode layer
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_metrics_frame(filepath, experiment):
+    """Read a metrics CSV into a DataFrame tagged with its experiment name.
+    
+    The value column is coerced to float64 here, N/A and other non-numeric
+    entries becoming NaN, to match the PyArrow and Polars readers.
+    """
+    df = pd.read_csv(filepath, comment='#')
+    if 'value' in df.columns:
+        df['value'] = pd.to_numeric(df['value'], errors='coerce').astype(np.float64)
+    df['experiment'] = experiment
+    return df
+
+
+def _read_metrics_table(filepath, experiment):
+    """Read a metrics CSV into a PyArrow Table tagged with its experiment name.
+    
+    The PyArrow CSV reader has no support for comment lines, so those are
+    stripped before parsing. String columns are dictionary-encoded while
+    parsing so they convert straight to pandas categoricals. The value column
+    is always float64 so tables from different files share a schema and can be
+    concatenated without copying.
+    """
+    with open(filepath, 'rb') as f:
+        data = b''.join(line for line in f if not line.lstrip().startswith(b'#'))
+    table = pyarrow.csv.read_csv(io.BytesIO(data),
+                                 convert_options=pyarrow.csv.ConvertOptions(auto_dict_encode=True))
+    
+    if 'value' in table.column_names:
+        index = table.schema.get_field_index('value')
+        try:
+            values = table.column(index).cast(pyarrow.float64())
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+            # Non-numeric entries (other than N/A): coerce them to NaN like pandas does
+            values = pyarrow.array(pd.to_numeric(table.column(index).to_pandas().astype(object), errors='coerce'),
+                                   type=pyarrow.float64())
+        table = table.set_column(index, 'value', values)
+    
+    # Constant column: a single-entry dictionary plus zeroed indices
+    experiment_column = pyarrow.DictionaryArray.from_arrays(
+        pyarrow.array(np.zeros(table.num_rows, dtype=np.int32)), pyarrow.array([experiment]))
+    return table.append_column('experiment', experiment_column)
+
+
+def _read_metrics_polars(filepath, experiment):
+    """Read a metrics CSV into a Polars DataFrame tagged with its experiment name.
+    
+    Polars skips comment lines itself and parses on its own thread pool. The
+    value column is read as text and cast leniently, so N/A and other
+    non-numeric entries become NaN as with pandas.
+    """
+    df = pl.read_csv(filepath, comment_prefix='#', schema_overrides={'value': pl.String})
+    if 'value' in df.columns:
+        df = df.with_columns(pl.col('value').cast(pl.Float64, strict=False))
+    return df.with_columns(pl.lit(experiment).alias('experiment'))
+
+
+def _concat_metrics_polars(frames):
+    """Concatenate per-file Polars frames and convert to pandas once.
+    
+    Text columns become Polars categoricals first so they arrive in pandas as
+    category dtype without building Python strings for every row.
+    """
+    df = pl.concat(frames, how='diagonal_relaxed')
+    return df.with_columns(pl.col(pl.String).cast(pl.Categorical)).to_pandas()
+
+
+def _concat_metrics_frames(frames):
+    """Concatenate per-file metrics DataFrames with one allocation per column.
+    
+    Avoids pd.concat's block-wise copy and index rebuild. Files with differing
+    columns fall back to pd.concat, which aligns them.
+    """
+    columns = list(frames[0].columns)
+    if any(list(frame.columns) != columns for frame in frames[1:]):
+        return pd.concat(frames, ignore_index=True)
+    data = {col: np.concatenate([frame[col].to_numpy() for frame in frames]) for col in columns}
+    return pd.DataFrame(data, copy=False)
+
+
+def _concat_metrics_tables(tables):
+    """Concatenate per-file metrics Tables and convert to pandas once."""
+    try:
+        return pyarrow.concat_tables(tables).to_pandas()
+    except pyarrow.ArrowInvalid:  # schemas differ between files
+        return pd.concat([table.to_pandas() for table in tables], ignore_index=True)
+
+
+def load_summary_files(pattern="summary_*.json", paths=None):
+    """Load all summary JSON files matching the pattern (or the given paths)."""
+    files = _find_files(pattern) if paths is None else paths
     if not files:
         print(f"No files found matching pattern: {pattern}")
         sys.exit(1)
     
     summaries = []
     for filepath in files:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-            summaries.append(data)
+        summaries.append(_read_json(filepath))
         print(f"Loaded: {filepath}")
     
     return summaries
 
 
-def load_metrics_csv_files(pattern="metrics_*.csv"):
-    """Load all metrics CSV files matching the pattern.
+def load_metrics_csv_files(pattern="metrics_*.csv", paths=None):
+    """Load all metrics CSV files matching the pattern (or the given paths).
     
     Returns a DataFrame with columns: experiment, component, metric, aggregation, unit, value
     """
-    files = glob.glob(pattern)
+    files = _find_files(pattern) if paths is None else paths
     if not files:
         print(f"No metrics files found matching pattern: {pattern}")
         return None
     
-    all_metrics = []
-    for filepath in files:
+    # Polars (converting through pyarrow) > PyArrow > pandas, whichever is installed
+    if pl is not None and pyarrow is not None:
+        read_metrics, concat_metrics = _read_metrics_polars, _concat_metrics_polars
+    elif pyarrow is not None:
+        read_metrics, concat_metrics = _read_metrics_table, _concat_metrics_tables
+    else:
+        read_metrics, concat_metrics = _read_metrics_frame, _concat_metrics_frames
+    
+    def load_one(filepath):
         # Extract experiment name from filename (e.g., metrics_1_concurrency_10.csv -> 1_concurrency_10)
         filename = os.path.basename(filepath)
-        match = re.match(r'metrics_(.+)\.(csv|log)', filename)
-        if match:
-            experiment = match.group(1)
-        else:
-            experiment = filename
-        
+        match = _METRICS_FILE_RE.match(filename)
+        experiment = match.group(1) if match else filename
         # Read CSV, skipping comment lines
         try:
-            df = pd.read_csv(filepath, comment='#')
-            df['experiment'] = experiment
-            all_metrics.append(df)
-            print(f"Loaded metrics: {filepath}")
+            return experiment, read_metrics(filepath, experiment), None
         except Exception as e:
-            print(f"Warning: Could not load {filepath}: {e}")
+            return experiment, None, e
+    
+    # Files are independent and the CSV parsers release the GIL, so read them
+    # concurrently; results come back in file order for stable output
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+        results = list(executor.map(load_one, files))
+    
+    all_metrics = []
+    row_counts = []
+    parsed = []  # (tenants, concurrency) per loaded file
+    for filepath, (experiment, metrics, error) in zip(files, results):
+        if error is not None:
+            print(f"Warning: Could not load {filepath}: {error}")
             continue
+        all_metrics.append(metrics)
+        row_counts.append(len(metrics))
+        parsed.append(_parse_experiment(experiment))
+        print(f"Loaded metrics: {filepath}")
     
     if not all_metrics:
         return None
     
     # Combine all metrics into a single DataFrame
-    metrics_df = pd.concat(all_metrics, ignore_index=True)
-    
-    # Parse experiment name to extract tenants and concurrency if possible
-    # Expected format: {tenants}_concurrency_{concurrency} (e.g., "1_concurrency_10", "10_concurrency_50")
-    def parse_experiment(exp):
-        match = re.match(r'(\d+)_concurrency_(\d+)', exp)
-        if match:
-            return int(match.group(1)), int(match.group(2))
-        return None, None
-    
-    metrics_df[['tenants', 'concurrency']] = metrics_df['experiment'].apply(
-        lambda x: pd.Series(parse_experiment(x))
-    )
+    metrics_df = concat_metrics(all_metrics)
+    
+    # Label columns repeat a handful of values; categorical codes make the
+    # comparisons, unique() and groupby calls in the charts run over small ints
+    for col in ('experiment', 'component', 'metric', 'aggregation', 'unit'):
+        if col in metrics_df.columns:
+            metrics_df[col] = metrics_df[col].astype('category')
+    
+    # Metric values only feed chart averages, so float32's ~7 significant digits
+    # are plenty; half-width values halve what the chart groupbys stream through
+    if 'value' in metrics_df.columns:
+        metrics_df['value'] = metrics_df['value'].astype(np.float32)
+    
+    # Tenants and concurrency were parsed once per file; broadcast them to that file's rows
+    tenants, concurrency = zip(*parsed)
+    metrics_df['tenants'] = pd.array(np.repeat(np.array(tenants, dtype=object), row_counts), dtype='Int64')
+    metrics_df['concurrency'] = pd.array(np.repeat(np.array(concurrency, dtype=object), row_counts), dtype='Int64')
     
     return metrics_df
 
 
+# Per-operation k6 metrics: name suffix -> (required metric type, [(k6 stat, column suffix)])
+OPERATION_METRICS = {
+    '_response_time': ('trend', [('avg', '_avg_ms'), ('p(90)', '_p90_ms'), ('p(95)', '_p95_ms'), ('max', '_max_ms')]),
+    '_passed': ('counter', [('count', '_passed'), ('rate', '_rps')]),
+    '_failed': ('counter', [('count', '_failed')]),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _operation_metric_columns(metric_name):
+    """Map a k6 metric name to (metric type, [(k6 stat, output column)]), or None.
+    
+    Every summary carries the same metric names, so the suffix matching and
+    column name formatting run once per distinct name rather than per summary.
+    """
+    for suffix, (metric_type, stats) in OPERATION_METRICS.items():
+        if metric_name.endswith(suffix):
+            base_name = metric_name[:-len(suffix)]
+            return metric_type, [(stat, f'{base_name}{column_suffix}') for stat, column_suffix in stats]
+    return None
+
+
 def extract_metrics(summary):
     """Extract relevant metrics from a single summary."""
     metrics = summary.get('data', {}).get('metrics', {})
@@ -94,28 +322,17 @@ def extract_metrics(summary):
         'concurrency': summary.get('concurrency', 0),
     }
     
-    # Process all metrics in a single pass
+    # Process all metrics in a single pass: response time trends and passed/failed counters
     for metric_name, metric_data in metrics.items():
+        spec = _operation_metric_columns(metric_name)
+        if spec is None:
+            continue
+        metric_type, columns = spec
+        if metric_data.get('type') != metric_type:
+            continue
         values = metric_data.get('values', {})
-        metric_type = metric_data.get('type')
-        
-        # Response time metrics (trend type)
-        if metric_name.endswith('_response_time') and metric_type == 'trend':
-            base_name = metric_name.replace('_response_time', '')
-            result[f'{base_name}_avg_ms'] = values.get('avg', 0)
-            result[f'{base_name}_p90_ms'] = values.get('p(90)', 0)
-            result[f'{base_name}_p95_ms'] = values.get('p(95)', 0)
-            result[f'{base_name}_max_ms'] = values.get('max', 0)
-        
-        # Passed/failed counters
-        elif metric_name.endswith('_passed') and metric_type == 'counter':
-            base_name = metric_name.replace('_passed', '')
-            result[f'{base_name}_passed'] = values.get('count', 0)
-            result[f'{base_name}_rps'] = values.get('rate', 0)
-        
-        elif metric_name.endswith('_failed') and metric_type == 'counter':
-            base_name = metric_name.replace('_failed', '')
-            result[f'{base_name}_failed'] = values.get('count', 0)
+        for stat, column in columns:
+            result[column] = values.get(stat, 0)
     
     # Extract http_reqs rate and count
     if 'http_reqs' in metrics:
@@ -134,8 +351,37 @@ def extract_metrics(summary):
 
 def create_dataframe(summaries):
     """Create a pandas DataFrame from all summaries."""
-    records = [extract_metrics(s) for s in summaries]
-    df = pd.DataFrame(records)
+    # Fill one typed NumPy array per column so pandas doesn't have to infer
+    # dtypes from a list of records. A column stays int64 while every value is
+    # an int; cells missing from a summary become NaN.
+    n = len(summaries)
+    columns = {}
+    present = {}
+    for i, summary in enumerate(summaries):
+        for name, value in extract_metrics(summary).items():
+            column = columns.get(name)
+            if column is None:
+                dtype = np.int64 if isinstance(value, int) else np.float64
+                column = columns[name] = np.zeros(n, dtype=dtype)
+                present[name] = np.zeros(n, dtype=bool)
+            if value is None:
+                continue
+            if column.dtype.kind == 'i' and not isinstance(value, int):
+                column = columns[name] = column.astype(np.float64)
+            column[i] = value
+            present[name][i] = True
+    
+    for name, column in columns.items():
+        missing = ~present[name]
+        if missing.any():
+            column = columns[name] = column.astype(np.float64)
+            column[missing] = np.nan
+    
+    # Let the constructor copy: it consolidates the columns into one 2-D block
+    # per dtype, stored column-major, so the sort below and every multi-column
+    # selection downstream (row means, heatmaps, CSV subsets) work on a couple
+    # of contiguous blocks instead of one small array per metric
+    df = pd.DataFrame(columns)
     
     # Sort by tenants and concurrency
     df = df.sort_values(['tenants', 'concurrency']).reset_index(drop=True)
@@ -143,25 +389,80 @@ def create_dataframe(summaries):
     return df
 
 
+def _input_signature(files):
+    """Cheap checksum of the input files (path, mtime and size).
+    
+    The report script itself is included so that cached frames are
+    invalidated whenever the extraction logic changes.
+    """
+    stats = []
+    for filepath in sorted(files) + [os.path.abspath(__file__)]:
+        st = os.stat(filepath)
+        stats.append((filepath, st.st_mtime_ns, st.st_size))
+    return hashlib.blake2b(repr(stats).encode(), digest_size=8).hexdigest()
+
+
+def cache_path(cache_dir, name, files):
+    """Path of the cache entry for these input files, or None when caching is off.
+    
+    Caching needs pyarrow for Feather support; without it this returns None.
+    """
+    if cache_dir is None or pyarrow is None or not files:
+        return None
+    return os.path.join(cache_dir, f'{name}_{_input_signature(files)}.feather')
+
+
+def load_cached_frame(path, name):
+    """Return the cached DataFrame stored at path, or None on a miss."""
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        df = pd.read_feather(path)
+    except Exception as e:
+        print(f"Warning: Could not read cache {path}: {e}")
+        return None
+    print(f"Loaded cached {name} data: {path}")
+    return df
+
+
+def save_cached_frame(df, path, name):
+    """Persist a DataFrame as a Feather sidecar, replacing stale entries for name."""
+    if path is None or df is None:
+        return
+    cache_dir = os.path.dirname(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Drop stale entries for the same frame before writing the new one
+        for stale in glob.glob(os.path.join(cache_dir, f'{name}_*.feather')):
+            os.remove(stale)
+        df.to_feather(path)
+    except Exception as e:
+        print(f"Warning: Could not write cache {path}: {e}")
+
+
 def save_csv(df, output_path="report_summary.csv"):
     """Save the DataFrame to CSV."""
     df.to_csv(output_path, index=False)
     print(f"\nCSV report saved to: {output_path}")
 
 
-def save_p95_csv(df, output_path="report_p95_latencies.csv"):
+def save_p95_csv(df, output_path="report_p95_latencies.csv", columns=None):
     """Save a CSV with only P95 latency columns."""
+    if columns is None:
+        columns = classify_columns(df)
     id_cols = ['tenants', 'concurrency']
-    p95_cols = [col for col in df.columns if col.endswith('_p95_ms')]
+    p95_cols = columns['p95']
     cols = id_cols + sorted(p95_cols)
     df[cols].to_csv(output_path, index=False)
     print(f"P95 latencies CSV saved to: {output_path}")
 
 
-def save_rps_csv(df, output_path="report_rps.csv"):
+def save_rps_csv(df, output_path="report_rps.csv", columns=None):
     """Save a CSV with only RPS columns."""
+    if columns is None:
+        columns = classify_columns(df)
     id_cols = ['tenants', 'concurrency']
-    rps_cols = [col for col in df.columns if col.endswith('_rps')]
+    rps_cols = list(columns['rps'])
     # Also include the overall http_reqs_rate if present
     if 'http_reqs_rate' in df.columns:
         rps_cols = ['http_reqs_rate'] + rps_cols
@@ -178,23 +479,10 @@ OPERATION_CATEGORIES = {
     'search': ['search_runs', 'search_experiments', 'search_prompts'],
 }
 
+OP_TO_CATEGORY = {op: category for category, ops in OPERATION_CATEGORIES.items() for op in ops}
 
-def _get_operation_category(operation):
-    """Get the category for an operation."""
-    for category, ops in OPERATION_CATEGORIES.items():
-        if operation in ops:
-            return category
-    return 'other'
-
-
-def _calculate_pct_change(baseline, value):
-    """Calculate percentage change from baseline to value."""
-    if baseline is None or value is None or baseline == 0:
-        return None
-    return round(((value - baseline) / baseline) * 100, 1)
 
-
-def save_latency_analysis_csv(df, output_dir="."):
+def save_latency_analysis_csv(df, output_dir=".", columns=None):
     """Generate latency analysis CSVs showing impact of tenant count on each operation.
     
     Creates two files:
@@ -203,7 +491,6 @@ def save_latency_analysis_csv(df, output_dir="."):
     """
     # Get unique tenant counts and concurrency levels
     tenant_counts = sorted(df['tenants'].unique())
-    concurrency_levels = sorted(df['concurrency'].unique())
     
     if len(tenant_counts) < 2:
         print("Skipping latency analysis - need at least 2 tenant configurations")
@@ -211,100 +498,66 @@ def save_latency_analysis_csv(df, output_dir="."):
     
     # Find baseline (minimum tenant count) and comparison targets
     baseline_tenants = min(tenant_counts)
+    compared_tenants = [t for t in tenant_counts if t != baseline_tenants]
     
     # Get all operations that have P95 metrics
-    operations = []
-    for col in df.columns:
-        if col.endswith('_p95_ms'):
-            op = col.replace('_p95_ms', '')
-            operations.append(op)
-    operations = sorted(operations)
-    
-    if not operations:
+    if columns is None:
+        columns = classify_columns(df)
+    p95_cols = {col: col[:-len('_p95_ms')] for col in sorted(columns['p95'])}
+    
+    if not p95_cols:
         print("Skipping latency analysis - no P95 metrics found")
         return
     
-    # Build detailed analysis records
-    detailed_records = []
-    
-    for op in operations:
-        p95_col = f'{op}_p95_ms'
-        if p95_col not in df.columns:
-            continue
-        
-        category = _get_operation_category(op)
-        
-        for concurrency in concurrency_levels:
-            record = {
-                'operation': op,
-                'category': category,
-                'concurrency': concurrency,
-            }
-            
-            # Get P95 value for each tenant count
-            baseline_value = None
-            for tenants in tenant_counts:
-                row = df[(df['tenants'] == tenants) & (df['concurrency'] == concurrency)]
-                if not row.empty:
-                    value = round(row[p95_col].values[0], 2)
-                    record[f'{tenants}_tenant{"s" if tenants > 1 else ""}_p95_ms'] = value
-                    if tenants == baseline_tenants:
-                        baseline_value = value
-            
-            # Calculate percentage changes from baseline
-            for tenants in tenant_counts:
-                if tenants == baseline_tenants:
-                    continue
-                col_name = f'{tenants}_tenant{"s" if tenants > 1 else ""}_p95_ms'
-                if col_name in record and baseline_value:
-                    pct_change = _calculate_pct_change(baseline_value, record[col_name])
-                    record[f'change_{baseline_tenants}_to_{tenants}_pct'] = pct_change
-            
-            detailed_records.append(record)
+    def tenant_col(tenants):
+        return f'{tenants}_tenant{"s" if tenants > 1 else ""}_p95_ms'
+    
+    def change_col(tenants):
+        return f'change_{baseline_tenants}_to_{tenants}_pct'
+    
+    # Long form (operation, tenants, concurrency, p95), then one pivot to a
+    # column per tenant count. If a configuration was loaded twice the first wins.
+    configs = df.drop_duplicates(['tenants', 'concurrency'])
+    long_df = configs.melt(id_vars=['tenants', 'concurrency'], value_vars=list(p95_cols),
+                           var_name='operation', value_name='p95_ms')
+    long_df['operation'] = long_df['operation'].map(p95_cols)
+    long_df['p95_ms'] = long_df['p95_ms'].astype(np.float64).round(2)
+    long_df['present'] = True
+    pivoted = long_df.pivot(index=['operation', 'concurrency'], columns='tenants')
+    detailed = pivoted['p95_ms']
+    # Configurations that were never run are absent; a NaN P95 from a run is not
+    present = pivoted['present'].notna()
+    
+    # Percentage changes from baseline; a zero baseline has no meaningful change
+    baseline = detailed[baseline_tenants]
+    changes = {}
+    for t in compared_tenants:
+        comparable = present[t] & present[baseline_tenants] & (baseline != 0)
+        if comparable.any():
+            changes[change_col(t)] = ((detailed[t] - baseline) / baseline * 100).round(1).where(comparable)
+            present[change_col(t)] = comparable
+    
+    detailed_df = (detailed.rename(columns=tenant_col).rename_axis(columns=None)
+                           .assign(**changes).reset_index())
+    detailed_df.insert(1, 'category', detailed_df['operation'].map(OP_TO_CATEGORY).fillna('other'))
     
     # Create detailed DataFrame and save
-    detailed_df = pd.DataFrame(detailed_records)
     detailed_path = os.path.join(output_dir, 'report_latency_analysis_by_tenants.csv')
     detailed_df.to_csv(detailed_path, index=False)
     print(f"Latency analysis (detailed) saved to: {detailed_path}")
     
-    # Build summary by category
-    summary_records = []
-    categories = sorted(set(r['category'] for r in detailed_records))
-    
-    for category in categories:
-        category_records = [r for r in detailed_records if r['category'] == category]
-        
-        for concurrency in concurrency_levels:
-            conc_records = [r for r in category_records if r['concurrency'] == concurrency]
-            if not conc_records:
-                continue
-            
-            summary = {
-                'category': category,
-                'concurrency': concurrency,
-            }
-            
-            # Average P95 for each tenant count
-            for tenants in tenant_counts:
-                col_name = f'{tenants}_tenant{"s" if tenants > 1 else ""}_p95_ms'
-                values = [r[col_name] for r in conc_records if col_name in r and r[col_name] is not None]
-                if values:
-                    summary[f'avg_{tenants}_tenant{"s" if tenants > 1 else ""}_p95_ms'] = round(np.mean(values), 2)
-            
-            # Average percentage changes
-            for tenants in tenant_counts:
-                if tenants == baseline_tenants:
-                    continue
-                pct_col = f'change_{baseline_tenants}_to_{tenants}_pct'
-                values = [r[pct_col] for r in conc_records if pct_col in r and r[pct_col] is not None]
-                if values:
-                    summary[f'avg_change_{baseline_tenants}_to_{tenants}_pct'] = round(np.mean(values), 1)
-            
-            summary_records.append(summary)
+    # Build summary by category. Absent values are skipped, but a NaN that was
+    # actually measured makes the category average NaN.
+    present = present.rename(columns=lambda c: tenant_col(c) if c in tenant_counts else c)
+    value_cols = [tenant_col(t) for t in tenant_counts] + list(changes)
+    keys = [detailed_df['category'], detailed_df['concurrency']]
+    poisoned = (detailed_df[value_cols].isna() & present[value_cols].to_numpy()).groupby(keys).any()
+    summary_df = detailed_df[value_cols].groupby(keys).mean().mask(poisoned)
+    decimals = {**{tenant_col(t): 2 for t in tenant_counts}, **{col: 1 for col in changes}}
+    summary_df = summary_df.round(decimals)
+    summary_df = summary_df.add_prefix('avg_').reset_index()
     
     # Create summary DataFrame and save
-    summary_df = pd.DataFrame(summary_records)
     summary_path = os.path.join(output_dir, 'report_latency_analysis_summary.csv')
     summary_df.to_csv(summary_path, index=False)
     print(f"Latency analysis (summary) saved to: {summary_path}")
@@ -339,30 +592,133 @@ def get_series_style(index):
     return color, marker
 
 
-def _save_chart(filepath):
-    """Save current figure to file and close it."""
-    plt.tight_layout()
-    plt.savefig(filepath, dpi=150, bbox_inches='tight')
-    plt.close()
+@functools.lru_cache(maxsize=32)
+def _palette(name, n):
+    """Sample n evenly spaced RGBA colors from a colormap, cached per (name, n).
+    
+    The array is shared between calls, so it is returned read-only.
+    """
+    colors = matplotlib.colormaps[name](np.linspace(0, 1, n))
+    colors.setflags(write=False)
+    return colors
+
+
+# Per-thread figure reused by every chart drawn on that thread; see _chart_figure()
+_FIGURES = threading.local()
+
+
+def _chart_figure(figsize):
+    """Return this thread's chart figure, cleared and resized.
+    
+    Creating a new Figure per chart repeats canvas and backend setup, so one
+    figure is cleared and reused instead. Each thread gets its own, and
+    charts only call methods on the figure they were handed (never pyplot's
+    "current figure"), so charts can render concurrently on threads.
+    """
+    fig = getattr(_FIGURES, 'figure', None)
+    if fig is None:
+        # Plain Figure on an Agg canvas: no pyplot state machine or figure
+        # registry (whose numbering is not thread-safe), and savefig needs no
+        # canvas switch per call
+        fig = _FIGURES.figure = Figure()
+        FigureCanvasAgg(fig)
+    fig.clear()
+    fig.set_size_inches(figsize)
+    return fig
+
+
+def _save_chart(fig, filepath, dpi=100):
+    """Save a chart figure to file.
+    
+    Charts are rasterized at matplotlib's default 100 dpi; rendering and
+    encoding cost grow with the pixel count, so only the summary dashboard
+    asks for more.
+    
+    PNGs are written with zlib level 1 rather than the default 6: encoding is
+    several times faster for slightly larger files. tight_layout already
+    makes room for outside legends, so bbox_inches='tight' (which renders
+    the whole figure an extra time to measure it) is not used.
+    """
+    fig.tight_layout()
+    fig.savefig(filepath, dpi=dpi, pil_kwargs={'compress_level': 1})
     print(f"Chart saved: {filepath}")
 
 
-def _add_config_column(df):
-    """Add a 'config' column with T{tenants}_C{concurrency} format."""
-    df = df.copy()
-    df['config'] = df.apply(lambda r: f"T{int(r['tenants'])}_C{int(r['concurrency'])}", axis=1)
-    return df
+def _row_nanmean(df, cols):
+    """Row-wise mean of the given columns, ignoring NaN, computed directly in NumPy."""
+    values = df[cols].to_numpy(dtype=np.float64)
+    counts = np.count_nonzero(~np.isnan(values), axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.nansum(values, axis=1) / counts
+
+
+def add_derived_columns(df, operations):
+    """Add the columns shared by several charts in a single copy of the frame.
+    
+    - config: T{tenants}_C{concurrency} label
+    - overall_p95_ms / overall_avg_ms: mean across all operations per configuration
+    """
+    derived = {'config': _config_labels(df)}
+    for suffix in ('p95', 'avg'):
+        cols = [f'{op}_{suffix}_ms' for op in operations if f'{op}_{suffix}_ms' in df.columns]
+        if cols:
+            derived[f'overall_{suffix}_ms'] = _row_nanmean(df, cols)
+    return df.assign(**derived)
+
+
+def _config_labels(df):
+    """Return the T{tenants}_C{concurrency} label for each row."""
+    if 'config' in df.columns:
+        return df['config']
+    return 'T' + df['tenants'].astype(int).astype(str) + '_C' + df['concurrency'].astype(int).astype(str)
+
+
+# Column suffixes that identify a per-operation metric
+OPERATION_SUFFIXES = ('_avg_ms', '_passed')
+
+# Column suffix -> classify_columns key
+COLUMN_KINDS = {'_p95_ms': 'p95', '_avg_ms': 'avg', '_passed': 'passed', '_rps': 'rps'}
+
+# Columns added by add_derived_columns; they share suffixes with real metrics
+DERIVED_COLUMNS = {'config', 'overall_p95_ms', 'overall_avg_ms'}
+
+
+def classify_columns(df):
+    """Sort the metric columns by kind in a single pass over df.columns.
+    
+    Returns a dict with 'p95', 'avg', 'passed' and 'rps' column tuples (in frame
+    order) and 'ops', the sorted operation names.
+    """
+    return dict(_classify_column_names(tuple(df.columns)))
+
+
+@functools.lru_cache(maxsize=8)
+def _classify_column_names(column_names):
+    """classify_columns worker, memoized on the column names.
+    
+    The same few frames (summary, with and without derived columns) are
+    classified by every report and chart, so repeat calls are a dict lookup.
+    """
+    columns = {kind: [] for kind in COLUMN_KINDS.values()}
+    ops = set()
+    suffixes = tuple(COLUMN_KINDS)
+    for col in column_names:
+        if col in DERIVED_COLUMNS or not col.endswith(suffixes):
+            continue
+        for suffix, kind in COLUMN_KINDS.items():
+            if col.endswith(suffix):
+                columns[kind].append(col)
+                if suffix in OPERATION_SUFFIXES:
+                    ops.add(col[:-len(suffix)])
+                break
+    columns = {kind: tuple(cols) for kind, cols in columns.items()}
+    columns['ops'] = tuple(sorted(ops))
+    return columns
 
 
 def get_operation_names(df):
     """Extract unique operation names from columns."""
-    ops = set()
-    for col in df.columns:
-        if col.endswith('_avg_ms'):
-            ops.add(col.replace('_avg_ms', ''))
-        elif col.endswith('_passed'):
-            ops.add(col.replace('_passed', ''))
-    return sorted(ops)
+    return classify_columns(df)['ops']
 
 
 def _setup_line_axis(ax, xlabel, ylabel, title, show_legend=True):
@@ -385,10 +741,17 @@ def _plot_multi_series(ax, group, x_col, series_configs):
 
 
 def _safe_max(series):
-    """Return max of a Series/array, or None if empty/NaN."""
+    """Return max of a Series/DataFrame/array, or None if empty/NaN."""
     if series is None:
         return None
-    max_val = pd.to_numeric(series, errors='coerce').max()
+    values = series.to_numpy() if hasattr(series, 'to_numpy') else np.asarray(series)
+    if values.dtype.kind in 'fiu':
+        # Already numeric: reduce in NumPy and skip the to_numeric coercion pass
+        values = values.astype(np.float64, copy=False).ravel()
+        values = values[~np.isnan(values)]
+        max_val = values.max() if values.size else np.nan
+    else:
+        max_val = pd.to_numeric(pd.Series(values.ravel()), errors='coerce').max()
     if pd.isna(max_val):
         return None
     return float(max_val)
@@ -412,7 +775,8 @@ def _plot_grouped_subplots(df, group_by, x_col, plot_func, filename, output_dir=
     if num_groups == 0:
         return
     
-    fig, axes = plt.subplots(1, num_groups, figsize=(7 * num_groups, 6), squeeze=False)
+    fig = _chart_figure((7 * num_groups, 6))
+    axes = fig.subplots(1, num_groups, squeeze=False)
     
     for idx, (group_value, group) in enumerate(groups):
         group = group.sort_values(x_col)
@@ -420,14 +784,16 @@ def _plot_grouped_subplots(df, group_by, x_col, plot_func, filename, output_dir=
         if y_max is not None and np.isfinite(y_max):
             axes[0, idx].set_ylim(top=y_max)
     
-    _save_chart(os.path.join(output_dir, filename))
+    _save_chart(fig, os.path.join(output_dir, filename))
 
 
-def _plot_response_times(df, output_dir, group_by, x_col, xlabel, title_suffix, filename):
+def _plot_response_times(df, output_dir, group_by, x_col, xlabel, title_suffix, filename, operations=None):
     """Generic helper to plot P95 response times grouped by a dimension."""
-    operations = get_operation_names(df)
+    if operations is None:
+        operations = get_operation_names(df)
     p95_cols = [f'{op}_p95_ms' for op in operations if f'{op}_p95_ms' in df.columns]
-    y_max = _safe_max(df[p95_cols].max().max()) * 1.1 if p95_cols else None
+    col_max = _safe_max(df[p95_cols]) if p95_cols else None
+    y_max = col_max * 1.1 if col_max is not None else None
     
     def plot_func(ax, group, x, group_val):
         series = [(f'{op}_p95_ms', op, *get_series_style(i)) for i, op in enumerate(operations)]
@@ -437,23 +803,25 @@ def _plot_response_times(df, output_dir, group_by, x_col, xlabel, title_suffix,
     _plot_grouped_subplots(df, group_by, x_col, plot_func, filename, output_dir, y_max=y_max)
 
 
-def plot_response_times_by_concurrency(df, output_dir="."):
+def plot_response_times_by_concurrency(df, output_dir=".", operations=None):
     """Plot P95 response times vs concurrency for each tenant configuration."""
     _plot_response_times(df, output_dir, 'tenants', 'concurrency', 'Concurrency', 
-                         'Tenant(s)', 'chart_response_times_by_concurrency.png')
+                         'Tenant(s)', 'chart_response_times_by_concurrency.png', operations)
 
 
-def plot_response_times_by_tenants(df, output_dir="."):
+def plot_response_times_by_tenants(df, output_dir=".", operations=None):
     """Plot P95 response times vs tenants for each concurrency configuration."""
     _plot_response_times(df, output_dir, 'concurrency', 'tenants', 'Tenants',
-                         'Concurrency', 'chart_response_times_by_tenants.png')
+                         'Concurrency', 'chart_response_times_by_tenants.png', operations)
 
 
-def _plot_rps(df, output_dir, group_by, x_col, xlabel, title_suffix, filename):
+def _plot_rps(df, output_dir, group_by, x_col, xlabel, title_suffix, filename, operations=None):
     """Generic helper to plot RPS (requests per second) grouped by a dimension."""
-    operations = get_operation_names(df)
+    if operations is None:
+        operations = get_operation_names(df)
     rps_cols = [f'{op}_rps' for op in operations if f'{op}_rps' in df.columns]
-    y_max = _safe_max(df[rps_cols].max().max()) * 1.1 if rps_cols else None
+    col_max = _safe_max(df[rps_cols]) if rps_cols else None
+    y_max = col_max * 1.1 if col_max is not None else None
     
     def plot_func(ax, group, x, group_val):
         series = [(f'{op}_rps', op, *get_series_style(i)) for i, op in enumerate(operations)]
@@ -463,16 +831,20 @@ def _plot_rps(df, output_dir, group_by, x_col, xlabel, title_suffix, filename):
     _plot_grouped_subplots(df, group_by, x_col, plot_func, filename, output_dir, y_max=y_max)
 
 
-def plot_rps_by_concurrency(df, output_dir="."):
+def plot_rps_by_concurrency(df, output_dir=".", operations=None):
     """Plot RPS vs concurrency for each tenant configuration."""
     _plot_rps(df, output_dir, 'tenants', 'concurrency', 'Concurrency', 
-              'Tenant(s)', 'chart_rps_by_concurrency.png')
+              'Tenant(s)', 'chart_rps_by_concurrency.png', operations)
 
 
-def plot_rps_by_tenants(df, output_dir="."):
+def plot_rps_by_tenants(df, output_dir=".", operations=None):
     """Plot RPS vs tenants for each concurrency configuration."""
     _plot_rps(df, output_dir, 'concurrency', 'tenants', 'Tenants',
-              'Concurrency', 'chart_rps_by_tenants.png')
+              'Concurrency', 'chart_rps_by_tenants.png', operations)
+
+
+# Largest tenants x concurrency grid whose heatmap cells get value labels
+HEATMAP_MAX_ANNOTATED_CELLS = 200
 
 
 def _plot_heatmap(df, value_col, title, colorbar_label, filename, output_dir=".", value_format=".1f"):
@@ -490,14 +862,20 @@ def _plot_heatmap(df, value_col, title, colorbar_label, filename, output_dir="."
     if value_col not in df.columns:
         return
     
-    pivot = df.pivot_table(index='tenants', columns='concurrency', values=value_col, aggfunc='mean')
+    # groupby + unstack takes the cython mean kernel directly instead of pivot_table's
+    # generic aggregation path; dropping NaN cells matches pivot_table's dropna
+    pivot = (df.groupby(['tenants', 'concurrency'], sort=True)[value_col]
+               .mean().dropna().unstack('concurrency'))
     
     if pivot.empty:
         return
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    values = pivot.to_numpy(dtype=np.float64)
     
-    im = ax.imshow(pivot.values, cmap='YlOrRd', aspect='auto')
+    fig = _chart_figure((10, 6))
+    ax = fig.subplots()
+    
+    im = ax.imshow(values, cmap='YlOrRd', aspect='auto')
     
     ax.set_xticks(range(len(pivot.columns)))
     ax.set_xticklabels(pivot.columns)
@@ -508,15 +886,15 @@ def _plot_heatmap(df, value_col, title, colorbar_label, filename, output_dir="."
     ax.set_ylabel('Tenants')
     ax.set_title(title)
     
-    # Add value annotations
-    for i in range(len(pivot.index)):
-        for j in range(len(pivot.columns)):
-            val = pivot.values[i, j]
-            if not np.isnan(val):
-                ax.text(j, i, f'{val:{value_format}}', ha='center', va='center', fontsize=10)
+    # Add value annotations, visiting only the non-NaN cells. Each label is a
+    # separate text artist, so large grids (where they would overlap anyway)
+    # are left to the colorbar.
+    if values.size <= HEATMAP_MAX_ANNOTATED_CELLS:
+        for i, j in zip(*np.nonzero(~np.isnan(values))):
+            ax.text(j, i, f'{values[i, j]:{value_format}}', ha='center', va='center', fontsize=10)
     
-    plt.colorbar(im, ax=ax, label=colorbar_label)
-    _save_chart(os.path.join(output_dir, filename))
+    fig.colorbar(im, ax=ax, label=colorbar_label)
+    _save_chart(fig, os.path.join(output_dir, filename))
 
 
 def plot_throughput_heatmap(df, output_dir="."):
@@ -531,50 +909,53 @@ def plot_throughput_heatmap(df, output_dir="."):
     )
 
 
-def plot_passed_counts(df, output_dir="."):
+def plot_passed_counts(df, output_dir=".", operations=None):
     """Plot passed operation counts as grouped bar chart."""
-    operations = get_operation_names(df)
+    if operations is None:
+        operations = get_operation_names(df)
     passed_cols = [f'{op}_passed' for op in operations if f'{op}_passed' in df.columns]
     
     if not passed_cols:
         return
     
-    df = _add_config_column(df)
+    config = _config_labels(df)
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = _chart_figure((12, 6))
+    ax = fig.subplots()
     
     x = np.arange(len(df))
     width = 0.8 / len(passed_cols)
     
-    colors = plt.cm.Set2(np.linspace(0, 1, len(passed_cols)))
+    colors = _palette('Set2', len(passed_cols))
     
     for i, col in enumerate(passed_cols):
         offset = (i - len(passed_cols) / 2 + 0.5) * width
-        op_name = col.replace('_passed', '')
+        op_name = col[:-len('_passed')]
         ax.bar(x + offset, df[col], width, label=op_name, color=colors[i])
     
     ax.set_xlabel('Test Configuration (T=Tenants, C=Concurrency)')
     ax.set_ylabel('Passed Count')
     ax.set_title('Successful Operations by Configuration')
     ax.set_xticks(x)
-    ax.set_xticklabels(df['config'], rotation=45, ha='right')
+    ax.set_xticklabels(config, rotation=45, ha='right')
     ax.legend(bbox_to_anchor=(1.02, 1), loc='upper left', fontsize=8)
     ax.grid(True, alpha=0.3, axis='y')
     
-    _save_chart(os.path.join(output_dir, 'chart_passed_counts.png'))
+    _save_chart(fig, os.path.join(output_dir, 'chart_passed_counts.png'))
 
 
-def plot_response_times_p95_heatmap(df, output_dir="."):
+def plot_response_times_p95_heatmap(df, output_dir=".", operations=None):
     """Plot overall P95 response time as a heatmap of tenants vs concurrency."""
     # Calculate overall P95 as mean of all operation P95s
-    operations = get_operation_names(df)
+    if operations is None:
+        operations = get_operation_names(df)
     p95_cols = [f'{op}_p95_ms' for op in operations if f'{op}_p95_ms' in df.columns]
     
-    if not p95_cols:
-        return
-    
-    df = df.copy()
-    df['overall_p95_ms'] = df[p95_cols].mean(axis=1)
+    if 'overall_p95_ms' not in df.columns:
+        if not p95_cols:
+            return
+        df = pd.DataFrame({'tenants': df['tenants'], 'concurrency': df['concurrency'],
+                           'overall_p95_ms': _row_nanmean(df, p95_cols)})
     
     _plot_heatmap(
         df, 'overall_p95_ms',
@@ -597,25 +978,26 @@ def _setup_bar_axis(ax, x_labels, values, ylabel, title, color='steelblue'):
 
 def plot_summary_dashboard(df, output_dir="."):
     """Create a summary dashboard with key metrics."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig = _chart_figure((14, 10))
+    axes = fig.subplots(2, 2)
     
-    df = _add_config_column(df)
+    config = _config_labels(df)
     
     # 1. HTTP Request Rate
     if 'http_reqs_rate' in df.columns:
-        _setup_bar_axis(axes[0, 0], df['config'], df['http_reqs_rate'],
+        _setup_bar_axis(axes[0, 0], config, df['http_reqs_rate'],
                         'Requests/sec', 'HTTP Request Throughput', 'steelblue')
     
     # 2. Total HTTP Requests
     if 'http_reqs_total' in df.columns:
-        _setup_bar_axis(axes[0, 1], df['config'], df['http_reqs_total'],
+        _setup_bar_axis(axes[0, 1], config, df['http_reqs_total'],
                         'Total Requests', 'Total HTTP Requests', 'teal')
     
     # 3. HTTP Request Failure Rate (with conditional coloring)
     if 'http_req_failed_rate' in df.columns:
         colors = ['green' if r == 0 else 'orange' if r < 0.05 else 'red' 
                   for r in df['http_req_failed_rate']]
-        axes[1, 0].bar(df['config'], df['http_req_failed_rate'] * 100, color=colors)
+        axes[1, 0].bar(config, df['http_req_failed_rate'] * 100, color=colors)
         axes[1, 0].set_ylabel('Failure Rate (%)')
         axes[1, 0].set_title('HTTP Request Failure Rate')
         axes[1, 0].axhline(y=0, color='green', linestyle='--', alpha=0.5)
@@ -623,14 +1005,17 @@ def plot_summary_dashboard(df, output_dir="."):
         axes[1, 0].grid(True, alpha=0.3, axis='y')
     
     # 4. Average Response Time (all operations combined)
-    avg_cols = [col for col in df.columns if col.endswith('_avg_ms')]
-    if avg_cols:
-        overall_avg = df[avg_cols].mean(axis=1)
-        _setup_bar_axis(axes[1, 1], df['config'], overall_avg,
+    if 'overall_avg_ms' in df.columns:
+        overall_avg = df['overall_avg_ms']
+    else:
+        avg_cols = list(classify_columns(df)['avg'])
+        overall_avg = _row_nanmean(df, avg_cols) if avg_cols else None
+    if overall_avg is not None:
+        _setup_bar_axis(axes[1, 1], config, overall_avg,
                         'Avg Response Time (ms)', 'Overall Average Response Time', 'coral')
     
-    plt.suptitle('MLflow Performance Test Summary', fontsize=14, fontweight='bold')
-    _save_chart(os.path.join(output_dir, 'chart_summary_dashboard.png'))
+    fig.suptitle('MLflow Performance Test Summary', fontsize=14, fontweight='bold')
+    _save_chart(fig, os.path.join(output_dir, 'chart_summary_dashboard.png'), dpi=150)
 
 
 def _sort_experiments_numerically(experiments):
@@ -638,13 +1023,11 @@ def _sort_experiments_numerically(experiments):
     
     Expected format: {tenants}_concurrency_{concurrency} (e.g., "1_concurrency_10", "10_concurrency_50")
     """
-    def parse_key(exp):
-        match = re.match(r'(\d+)_concurrency_(\d+)', exp)
-        if match:
-            return (int(match.group(1)), int(match.group(2)))
-        return (float('inf'), float('inf'))  # Put unparseable at end
-    
-    return sorted(experiments, key=parse_key)
+    experiments = pd.Series(list(experiments), dtype=object)
+    keys = experiments.str.extract(_EXPERIMENT_RE).apply(pd.to_numeric)
+    # Unparseable names have NaN keys and go last, keeping their original order
+    order = keys.sort_values([0, 1], na_position='last', kind='stable').index
+    return experiments[order].tolist()
 
 
 def _plot_resource_utilization(metrics_df, metric_name, ylabel, title, filename, output_dir=".",
@@ -666,46 +1049,45 @@ def _plot_resource_utilization(metrics_df, metric_name, ylabel, title, filename,
         return
     
     # Filter for the specified metric
-    filtered_df = metrics_df[metrics_df['metric'] == metric_name].copy()
-    if filtered_df.empty and alt_metric_names:
-        filtered_df = metrics_df[metrics_df['metric'].isin(alt_metric_names)].copy()
+    metric_mask = metrics_df['metric'] == metric_name
+    if not metric_mask.any() and alt_metric_names:
+        metric_mask = metrics_df['metric'].isin(alt_metric_names)
     
-    if filtered_df.empty:
+    if not metric_mask.any():
         print(f"No {metric_name} metrics found")
         return
     
-    # Filter for avg only
-    filtered_df = filtered_df[filtered_df['aggregation'] == 'avg'].copy()
+    # Filter for avg only, in the same pass, taking just the columns the chart uses
+    filtered_df = metrics_df.loc[metric_mask & (metrics_df['aggregation'] == 'avg'),
+                                 ['experiment', 'component', 'value']]
     
-    # Convert value to numeric, handling N/A
-    filtered_df['value'] = pd.to_numeric(filtered_df['value'], errors='coerce')
+    # Values were coerced to float64 (N/A as NaN) once when the CSVs were loaded
+    plot_value = filtered_df['value']
     
     # Apply value transformation if provided
     if value_transform:
-        filtered_df['plot_value'] = value_transform(filtered_df['value'])
-    else:
-        filtered_df['plot_value'] = filtered_df['value']
+        plot_value = value_transform(plot_value)
     
     # Get unique components and experiments
     components = filtered_df['component'].unique()
     experiments = _sort_experiments_numerically(filtered_df['experiment'].unique())
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = _chart_figure((12, 6))
+    ax = fig.subplots()
     
-    colors = plt.cm.tab10(np.linspace(0, 1, len(components)))
+    colors = _palette('tab10', len(components))
     x = np.arange(len(experiments))
     width = 0.8 / len(components)
     
+    # One experiment x component matrix instead of masking the frame per cell
+    matrix = (plot_value.groupby([filtered_df['experiment'], filtered_df['component']], sort=False, observed=True)
+                        .mean().unstack('component')
+                        .reindex(index=list(experiments), columns=list(components)))
+    # Column-major so each component's bar heights are one contiguous slice
+    bar_values = np.asfortranarray(np.nan_to_num(matrix.to_numpy(dtype=np.float64), nan=0.0))
+    
     for comp_idx, component in enumerate(components):
-        comp_data = filtered_df[filtered_df['component'] == component]
-        values = []
-        for exp in experiments:
-            exp_data = comp_data[comp_data['experiment'] == exp]
-            if not exp_data.empty and not pd.isna(exp_data['plot_value'].values[0]):
-                values.append(exp_data['plot_value'].values[0])
-            else:
-                values.append(0)
-        
+        values = bar_values[:, comp_idx]
         offset = (comp_idx - len(components) / 2 + 0.5) * width
         ax.bar(x + offset, values, width, label=component, color=colors[comp_idx])
     
@@ -719,7 +1101,7 @@ def _plot_resource_utilization(metrics_df, metric_name, ylabel, title, filename,
     ax.legend(bbox_to_anchor=(1.02, 1), loc='upper left', fontsize=8)
     ax.grid(True, alpha=0.3, axis='y')
     
-    _save_chart(os.path.join(output_dir, filename))
+    _save_chart(fig, os.path.join(output_dir, filename))
 
 
 def plot_cpu_utilization(metrics_df, output_dir="."):
@@ -757,20 +1139,22 @@ def _prepare_mlflow_cpu_data(metrics_df):
         return None
     
     # Filter for mlflow CPU avg only
-    mlflow_cpu = metrics_df[
+    mask = (
         (metrics_df['component'] == 'mlflow') & 
         (metrics_df['metric'] == 'cpu') & 
         (metrics_df['aggregation'] == 'avg')
-    ].copy()
+    )
     
-    if mlflow_cpu.empty:
+    if not mask.any():
         print("No MLflow CPU metrics found")
         return None
     
-    mlflow_cpu['value'] = pd.to_numeric(mlflow_cpu['value'], errors='coerce')
-    mlflow_cpu = mlflow_cpu.rename(columns={'value': 'mlflow_cpu'})
-    
-    return mlflow_cpu
+    # Only take the columns the chart needs rather than copying the whole frame
+    return pd.DataFrame({
+        'tenants': metrics_df.loc[mask, 'tenants'],
+        'concurrency': metrics_df.loc[mask, 'concurrency'],
+        'mlflow_cpu': metrics_df.loc[mask, 'value'],
+    })
 
 
 def _plot_mlflow_cpu(metrics_df, output_dir, group_by, x_col, xlabel, title_suffix, filename):
@@ -778,7 +1162,11 @@ def _plot_mlflow_cpu(metrics_df, output_dir, group_by, x_col, xlabel, title_suff
     mlflow_cpu = _prepare_mlflow_cpu_data(metrics_df)
     if mlflow_cpu is None:
         return
-    y_max = _safe_max(mlflow_cpu['mlflow_cpu']) * 1.1 if _safe_max(mlflow_cpu['mlflow_cpu']) else None
+    # One point per (group, x): average repeated samples in a single groupby
+    # pass; the result is already sorted by group and x
+    mlflow_cpu = mlflow_cpu.groupby([group_by, x_col], sort=True)['mlflow_cpu'].mean().reset_index()
+    cpu_max = _safe_max(mlflow_cpu['mlflow_cpu'])
+    y_max = cpu_max * 1.1 if cpu_max else None
     
     def plot_func(ax, group, x, group_val):
         _plot_multi_series(ax, group, x, [('mlflow_cpu', 'mlflow', *get_series_style(0))])
@@ -799,9 +1187,89 @@ def plot_mlflow_cpu_by_tenants(metrics_df, output_dir="."):
                      'Concurrency', 'chart_mlflow_cpu_by_tenants.png')
 
 
+# Frames shared with chart worker processes, keyed by _FrameRef.key
+_WORKER_FRAMES = {}
+
+
+class _FrameRef:
+    """Placeholder for a DataFrame argument that was sent to the workers once."""
+    __slots__ = ('key',)
+    
+    def __init__(self, key):
+        self.key = key
+
+
+def _init_chart_worker(frames):
+    """Pool initializer: store the shared frames in the worker process."""
+    global _WORKER_FRAMES
+    _WORKER_FRAMES = frames
+
+
+def _render_chart(task):
+    """Run one (plot_fn, args, kwargs) chart task."""
+    plot_fn, args, kwargs = task
+    args = [_WORKER_FRAMES[arg.key] if isinstance(arg, _FrameRef) else arg for arg in args]
+    plot_fn(*args, **kwargs)
+
+
+def render_charts(tasks, jobs=None, threads=False):
+    """Render independent chart tasks, in parallel worker processes when jobs > 1.
+    
+    Each chart writes its own file and only reads its input frame, so the
+    matplotlib drawing and PNG encoding can run on separate cores. Worker
+    processes are only used when jobs is given: each one imports pandas,
+    matplotlib and the optional readers again, which takes seconds under the
+    spawn and forkserver start methods, so by default charts render serially.
+    With threads=True a thread pool (one thread per CPU unless jobs is given)
+    is used instead: there is no worker start-up or frame transfer, but drawing
+    mostly holds the GIL, so threads mainly overlap PNG encoding and file writes.
+    """
+    if jobs is None:
+        jobs = (os.cpu_count() or 1) if threads else 1
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            _render_chart(task)
+        return
+    
+    if threads:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+            list(executor.map(_render_chart, tasks))
+        return
+    
+    # Hand each distinct frame to the workers once (inherited on fork, pickled
+    # once per worker otherwise) instead of pickling it into every task
+    frames = {}
+    shared_tasks = []
+    for plot_fn, args, kwargs in tasks:
+        shared_args = []
+        for arg in args:
+            if isinstance(arg, pd.DataFrame):
+                frames.setdefault(id(arg), arg)
+                arg = _FrameRef(id(arg))
+            shared_args.append(arg)
+        shared_tasks.append((plot_fn, tuple(shared_args), kwargs))
+    
+    sys.stdout.flush()  # don't let forked workers inherit and re-emit buffered output
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=_init_chart_worker,
+                             initargs=(frames,)) as executor:
+        list(executor.map(_render_chart, shared_tasks))
+
+
+# Configurations printed in the console summary table
+SUMMARY_TABLE_MAX_ROWS = 50
+
+
+def _sorted_unique(series):
+    """Sorted distinct values of a Series as a plain list, deduplicated and sorted in NumPy."""
+    return np.sort(pd.unique(series.to_numpy())).tolist()
+
+
+_BAR = '=' * 60
+
+
 def _section(title):
     """Print a section header."""
-    print(f"\n{'=' * 60}\n{title}\n{'=' * 60}")
+    print(f"\n{_BAR}\n{title}\n{_BAR}")
 
 
 def main():
@@ -816,45 +1284,80 @@ def main():
                         help='Output directory for CSV and charts (default: current directory)')
     parser.add_argument('--csv-name', '-c', default='report_summary.csv',
                         help='Output CSV filename (default: report_summary.csv)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-parse input files instead of reusing cached data in <output-dir>/.report_cache')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Number of processes used to render charts (default: 1, charts render serially)')
+    parser.add_argument('--chart-threads', action='store_true',
+                        help='Render charts on threads instead of worker processes')
     args = parser.parse_args()
     
     os.makedirs(args.output_dir, exist_ok=True)
+    cache_dir = None if args.no_cache else os.path.join(args.output_dir, '.report_cache')
     _section("MLflow Performance Test Report Generator")
     
-    # Load and process summary files
+    # Load and process summary files, reusing the cached frame if inputs are unchanged
     print(f"\nSearching for files matching: {args.pattern}")
-    summaries = load_summary_files(args.pattern)
-    df = create_dataframe(summaries)
-    print(f"Found {len(summaries)} summary file(s), {len(df)} configurations")
-    print(f"Tenants: {sorted(df['tenants'].unique())}, Concurrency: {sorted(df['concurrency'].unique())}")
-    
+    # Both patterns usually point at the same results directory; list it once
+    summary_files, metrics_files = _find_files_many([args.pattern, args.metrics_pattern])
+    # Stat the inputs once; the same cache key is used for the lookup and the write
+    summary_cache = cache_path(cache_dir, 'summary', summary_files)
+    df = load_cached_frame(summary_cache, 'summary')
+    if df is None:
+        summaries = load_summary_files(args.pattern, paths=summary_files)
+        df = create_dataframe(summaries)
+        save_cached_frame(df, summary_cache, 'summary')
+    print(f"Found {len(summary_files)} summary file(s), {len(df)} configurations")
+    print(f"Tenants: {_sorted_unique(df['tenants'])}, Concurrency: {_sorted_unique(df['concurrency'])}")
+    
+    # Scan the columns once and share the classification across reports and charts
+    columns = classify_columns(df)
     save_csv(df, os.path.join(args.output_dir, args.csv_name))
-    save_p95_csv(df, os.path.join(args.output_dir, 'report_p95_latencies.csv'))
-    save_rps_csv(df, os.path.join(args.output_dir, 'report_rps.csv'))
-    save_latency_analysis_csv(df, args.output_dir)
+    save_p95_csv(df, os.path.join(args.output_dir, 'report_p95_latencies.csv'), columns)
+    save_rps_csv(df, os.path.join(args.output_dir, 'report_rps.csv'), columns)
+    save_latency_analysis_csv(df, args.output_dir, columns)
     
     # Summary table
     _section("Summary Table")
     display_cols = [c for c in ['tenants', 'concurrency', 'http_reqs_total', 'http_reqs_rate'] if c in df.columns]
-    print(df[display_cols].to_string(index=False))
+    # Tab-separated via the C CSV writer; to_string() formats every cell in Python.
+    # Large sweeps only show the first rows; the full table is in the CSV report.
+    df[display_cols].head(SUMMARY_TABLE_MAX_ROWS).to_csv(sys.stdout, sep='\t', index=False,
+                                                         lineterminator='\n', float_format='%.3f')
+    if len(df) > SUMMARY_TABLE_MAX_ROWS:
+        print(f"... ({len(df) - SUMMARY_TABLE_MAX_ROWS} more rows omitted)")
     
     # Generate k6 charts
     _section("Generating Charts")
-    for plot_fn in [plot_summary_dashboard, plot_response_times_by_concurrency, plot_response_times_by_tenants,
-                    plot_rps_by_concurrency, plot_rps_by_tenants,
-                    plot_throughput_heatmap, plot_passed_counts, plot_response_times_p95_heatmap]:
-        plot_fn(df, args.output_dir)
+    operations = columns['ops']
+    df = add_derived_columns(df, operations)
+    chart_tasks = [(plot_fn, (df, args.output_dir), {})
+                   for plot_fn in [plot_summary_dashboard, plot_throughput_heatmap]]
+    chart_tasks += [(plot_fn, (df, args.output_dir), {'operations': operations})
+                    for plot_fn in [plot_response_times_by_concurrency, plot_response_times_by_tenants,
+                                    plot_rps_by_concurrency, plot_rps_by_tenants,
+                                    plot_passed_counts, plot_response_times_p95_heatmap]]
+    render_charts(chart_tasks, args.jobs, args.chart_threads)
     
     # Process Prometheus metrics
     _section("Processing Prometheus Metrics")
     print(f"Searching for: {args.metrics_pattern}")
-    metrics_df = load_metrics_csv_files(args.metrics_pattern)
+    metrics_cache = cache_path(cache_dir, 'metrics', metrics_files)
+    metrics_df = load_cached_frame(metrics_cache, 'metrics')
+    if metrics_df is None:
+        metrics_df = load_metrics_csv_files(args.metrics_pattern, paths=metrics_files)
+        save_cached_frame(metrics_df, metrics_cache, 'metrics')
     
     if metrics_df is not None:
-        print(f"Found {len(metrics_df['experiment'].unique())} experiment(s), components: {sorted(metrics_df['component'].unique())}")
-        for plot_fn in [plot_cpu_utilization, plot_memory_utilization, 
-                        plot_mlflow_cpu_by_concurrency, plot_mlflow_cpu_by_tenants]:
-            plot_fn(metrics_df, args.output_dir)
+        num_experiments = metrics_df['experiment'].nunique()
+        print(f"Found {num_experiments} experiment(s), components: {_sorted_unique(metrics_df['component'])}")
+        plot_fns = [plot_cpu_utilization, plot_memory_utilization]
+        if num_experiments > 1:
+            plot_fns += [plot_mlflow_cpu_by_concurrency, plot_mlflow_cpu_by_tenants]
+        else:
+            print("Skipping MLflow CPU trend charts - need at least 2 experiments")
+        render_charts([(plot_fn, (metrics_df, args.output_dir), {}) for plot_fn in plot_fns],
+                      args.jobs, args.chart_threads)
     else:
         print("No metrics files found - skipping resource charts")
     